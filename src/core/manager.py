@@ -1,75 +1,203 @@
 import asyncio
+import dataclasses
 import logging
-from typing import Any, List, Optional, Set
+import struct
+import threading
+from typing import Optional, Set, Tuple, Union
+
+import numpy as np
+import orjson
 
 from src.hardware.pyrplidar_impl import PyRPlidarImpl
 
-from .models import LidarConfig, LidarPoint, LidarScan
+from .models import LidarConfig, LidarScan
 
 logger = logging.getLogger(__name__)
 
+# Fixed JSON scaffold of a scan; only the timestamp and the column arrays are spliced in
+_SCAN_JSON_TIMESTAMP = b'{"timestamp":'
+_SCAN_JSON_ANGLES = b',"angles":'
+_SCAN_JSON_DISTANCES = b',"distances":'
+_SCAN_JSON_INTENSITIES = b',"intensities":'
+_SCAN_JSON_END = b"}"
+
+# WebSocket envelope wrapped around the cached scan JSON
+_SCAN_MESSAGE_PREFIX = b'{"type":"lidar_scan","data":'
+_SCAN_MESSAGE_SUFFIX = b"}"
+
+# Binary frame header: float64 timestamp, uint32 point count (little-endian),
+# followed by the quantized uint16 angle, distance and intensity columns
+BINARY_FRAME_HEADER = struct.Struct("<dI")
+
+
+class LatestSlot:
+    """
+    Single-value mailbox for one subscriber.
+    Publishing overwrites the previous value, which gives 'Drop Oldest' semantics
+    without the bookkeeping of a full asyncio.Queue.
+    """
+
+    __slots__ = ("value", "event")
+
+    def __init__(self):
+        self.value: Optional[Union[str, bytes]] = None
+        self.event = asyncio.Event()
+
+    def put(self, value: Union[str, bytes]):
+        """Replace the stored value and wake the consumer."""
+        self.value = value
+        self.event.set()
+
+    async def get(self) -> Union[str, bytes]:
+        """Wait for a value newer than the last one retrieved."""
+        await self.event.wait()
+        self.event.clear()
+        return self.value
+
 
 class LidarManager:
     def __init__(self, config: LidarConfig):
         self.config = config
         self._hal = PyRPlidarImpl(config)
-        self._loop = asyncio.get_event_loop()
-        self._subscribers: Set[asyncio.Queue] = set()
+        # Bound in start(), which runs on the event loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribers: Set[LatestSlot] = set()
+        self._binary_subscribers: Set[LatestSlot] = set()
 
-        self._last_scan: Optional[LidarScan] = None
+        # Immutable copies iterated by _publish; rebuilt only when membership changes
+        self._subscribers_snapshot: Tuple[LatestSlot, ...] = ()
+        self._binary_subscribers_snapshot: Tuple[LatestSlot, ...] = ()
 
-    def subscribe(self) -> asyncio.Queue:
-        """Create and return a new data queue for a transport (L3)."""
-        queue = asyncio.Queue(maxsize=10)
-        self._subscribers.add(queue)
-        logger.info(f"New subscriber added. Total: {len(self._subscribers)}")
-        return queue
+        # Single-slot handoff from the HAL thread: newer scans overwrite a pending one
+        self._pending_scan: Optional[LidarScan] = None
+        self._pending_lock = threading.Lock()
 
-    def unsubscribe(self, queue: asyncio.Queue):
-        """Remove a transport queue from subscribers."""
-        self._subscribers.discard(queue)
-        logger.info(f"Subscriber removed. Total: {len(self._subscribers)}")
+        self._last_scan: Optional[LidarScan] = None
+        self._last_scan_json: Optional[bytes] = None
 
-    def _raw_callback(self, measurements: List[Any]):
+    def subscribe(self, binary: bool = False) -> LatestSlot:
+        """
+        Create and return a new data slot for a transport (L3).
+        The slot holds the latest pre-encoded message: a JSON string,
+        or a binary frame (see BINARY_FRAME_HEADER) when binary is set.
+        """
+        slot = LatestSlot()
+        if binary:
+            self._binary_subscribers.add(slot)
+        else:
+            self._subscribers.add(slot)
+        self._refresh_snapshots()
+        logger.info(f"New subscriber added. Total: {self.subscriber_count}")
+        return slot
+
+    def unsubscribe(self, slot: LatestSlot):
+        """Remove a transport slot from subscribers."""
+        self._subscribers.discard(slot)
+        self._binary_subscribers.discard(slot)
+        self._refresh_snapshots()
+        logger.info(f"Subscriber removed. Total: {self.subscriber_count}")
+
+    def _refresh_snapshots(self):
+        """Rebuild the tuples walked by the per-scan fan-out."""
+        self._subscribers_snapshot = tuple(self._subscribers)
+        self._binary_subscribers_snapshot = tuple(self._binary_subscribers)
+
+    def _raw_callback(
+        self,
+        angles: np.ndarray,
+        distances: np.ndarray,
+        intensities: np.ndarray,
+        timestamp: float,
+    ):
         """
         Callback triggered by L1 (Thread).
-        Converts raw data and schedules push to async queues.
+        Wraps the revolution columns and schedules push to subscriber slots.
+        Only one loop wakeup is scheduled while a scan is still pending.
         """
-        points = [
-            LidarPoint(angle=m.angle, distance=m.distance, intensity=m.quality)
-            for m in measurements
-        ]
-        scan = LidarScan(points=points)
-
-        self._loop.call_soon_threadsafe(self._publish, scan)
+        scan = LidarScan(
+            angles=angles, distances=distances, intensities=intensities, timestamp=timestamp
+        )
+
+        with self._pending_lock:
+            schedule = self._pending_scan is None
+            self._pending_scan = scan
+
+        if not schedule:
+            return
+
+        self._loop.call_soon_threadsafe(self._flush_pending)
+
+    def _flush_pending(self):
+        """Publish the most recent pending scan on the event loop."""
+        with self._pending_lock:
+            scan, self._pending_scan = self._pending_scan, None
+
+        if scan is not None:
+            self._publish(scan)
+
+    @staticmethod
+    def _encode(scan: LidarScan) -> bytes:
+        """Serialize a scan (timestamp and point columns) to JSON, with angles in degrees."""
+        option = orjson.OPT_SERIALIZE_NUMPY
+        return b"".join(
+            (
+                _SCAN_JSON_TIMESTAMP,
+                orjson.dumps(scan.timestamp),
+                _SCAN_JSON_ANGLES,
+                orjson.dumps(scan.angles_deg, option=option),
+                _SCAN_JSON_DISTANCES,
+                orjson.dumps(scan.distances, option=option),
+                _SCAN_JSON_INTENSITIES,
+                orjson.dumps(scan.intensities, option=option),
+                _SCAN_JSON_END,
+            )
+        )
+
+    @staticmethod
+    def _encode_binary(scan: LidarScan) -> bytes:
+        """Pack a scan into a binary frame: header followed by the quantized columns."""
+        header = BINARY_FRAME_HEADER.pack(scan.timestamp, len(scan.angles))
+        # Column byte order is fixed by the frame format; astype is a no-op on little-endian hosts
+        return b"".join(
+            (
+                header,
+                scan.angles.astype("<u2", copy=False).data,
+                scan.distances.astype("<u2", copy=False).data,
+                scan.intensities.astype("<u2", copy=False).data,
+            )
+        )
 
     def _publish(self, scan: LidarScan):
-        """Push scan to all subscriber queues and update the cache."""
+        """Encode scan once per format, push it to all subscriber slots and update the caches."""
         self._last_scan = scan
+        self._last_scan_json = self._encode(scan)
+        payload = (_SCAN_MESSAGE_PREFIX + self._last_scan_json + _SCAN_MESSAGE_SUFFIX).decode()
 
-        for q in self._subscribers:
-            if q.full():
-                try:
-                    q.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-            q.put_nowait(scan)
+        for slot in self._subscribers_snapshot:
+            slot.put(payload)
+
+        binary_subscribers = self._binary_subscribers_snapshot
+        if binary_subscribers:
+            frame = self._encode_binary(scan)
+            for slot in binary_subscribers:
+                slot.put(frame)
 
     async def start(self):
         """Initialize HAL and start scanning."""
-        await asyncio.to_thread(self._hal.connect)
+        self._loop = asyncio.get_running_loop()
+        await self._hal.submit(self._hal.connect)
         self._hal.start_scan(callback=self._raw_callback)
         logger.info("LidarManager: Scanning started")
 
     async def stop(self):
         """Graceful shutdown."""
-        await asyncio.to_thread(self._hal.disconnect)
+        await self._hal.submit(self._hal.disconnect)
         logger.info("LidarManager: Stopped")
 
     async def update_config(self, new_config: LidarConfig):
         """Apply new hardware settings on the fly."""
         if new_config.motor_pwm != self.config.motor_pwm:
-            await asyncio.to_thread(self._hal.update_parameters, new_config.motor_pwm)
+            await self._hal.submit(self._hal.update_parameters, new_config.motor_pwm)
         self.config = new_config
 
     @property
@@ -80,9 +208,25 @@ class LidarManager:
     @property
     def subscriber_count(self) -> int:
         """Public access to the number of active data listeners."""
-        return len(self._subscribers)
+        return len(self._subscribers) + len(self._binary_subscribers)
 
     @property
     def last_scan(self) -> Optional[LidarScan]:
-        """Public access to the most recent LiDAR scan."""
-        return self._last_scan
+        """
+        Public access to the most recent LiDAR scan.
+        Returns a copy owning its arrays, as the cached scan shares the HAL's reusable buffers.
+        """
+        scan = self._last_scan
+        if scan is None:
+            return None
+        return dataclasses.replace(
+            scan,
+            angles=scan.angles.copy(),
+            distances=scan.distances.copy(),
+            intensities=scan.intensities.copy(),
+        )
+
+    @property
+    def last_scan_json(self) -> Optional[bytes]:
+        """Public access to the most recent LiDAR scan, already encoded as JSON."""
+        return self._last_scan_json
@@ -1,22 +1,33 @@
 import time
-from typing import Any, Dict, List, Literal, Union
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Literal
 
+import numpy as np
 from pydantic import BaseModel, Field
 
+# Scan angles are quantized to 0.01 degree steps
+ANGLE_UNITS_PER_DEGREE = 100
 
-class LidarPoint(BaseModel):
-    """Normalized LiDAR point."""
-
-    angle: float = Field(..., ge=0, le=360)
-    distance: float = Field(..., ge=0)
-    intensity: float = Field(..., ge=0)
 
+@dataclass(frozen=True, slots=True)
+class LidarScan:
+    """
+    Full 360-degree revolution batch.
+    Points are stored column-wise as quantized uint16 arrays. This is a plain
+    dataclass rather than a Pydantic model, so building it on every revolution
+    costs no validation. Scans produced by the HAL share its reusable buffers;
+    LidarManager.last_scan hands out copies that own their data.
+    """
 
-class LidarScan(BaseModel):
-    """Full 360-degree revolution batch."""
+    angles: np.ndarray  # uint16, 0.01 degree units (see ANGLE_UNITS_PER_DEGREE)
+    distances: np.ndarray  # uint16, millimeters
+    intensities: np.ndarray  # uint16, raw quality reported by the sensor
+    timestamp: float = field(default_factory=time.time)
 
-    timestamp: float = Field(default_factory=time.time)
-    points: List[LidarPoint]
+    @property
+    def angles_deg(self) -> np.ndarray:
+        """Dequantized angles in degrees (float32)."""
+        return self.angles / np.float32(ANGLE_UNITS_PER_DEGREE)
 
 
 class LidarConfig(BaseModel):
@@ -46,14 +57,13 @@ class WSMessage(BaseModel):
     """
     Standard envelope for all WebSocket communications.
     The 'type' field acts as a header for message routing.
+    Scan messages are encoded directly by LidarManager; this model documents the schema.
     """
 
     type: Literal["lidar_scan", "system_status", "error"] = Field(
         ..., description="Type of the message payload"
     )
-    data: Union[LidarScan, Dict[str, Any]] = Field(
-        ..., description="The actual payload (Scan data or status info)"
-    )
+    data: Dict[str, Any] = Field(..., description="The actual payload (Scan data or status info)")
 
     model_config = {
         "json_schema_extra": {
@@ -61,7 +71,9 @@ class WSMessage(BaseModel):
                 "type": "lidar_scan",
                 "data": {
                     "timestamp": 1704123456.789,
-                    "points": [{"angle": 0.0, "distance": 150.5, "intensity": 45}],
+                    "angles": [0.0, 0.8],
+                    "distances": [150, 152],
+                    "intensities": [45, 47],
                 },
             }
         }
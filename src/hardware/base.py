@@ -1,5 +1,12 @@
 from abc import ABC, abstractmethod
 from enum import Enum
+from typing import Callable
+
+import numpy as np
+
+# (angles, distances, intensities, timestamp) for one completed revolution.
+# The arrays may alias HAL-owned buffers that are reused on later revolutions.
+ScanCallback = Callable[[np.ndarray, np.ndarray, np.ndarray, float], None]
 
 
 class LidarStatus(Enum):
@@ -15,7 +22,7 @@ class BaseLidar(ABC):
     def connect(self): ...
 
     @abstractmethod
-    def start_scan(self, callback): ...
+    def start_scan(self, callback: ScanCallback): ...
 
     @abstractmethod
     def stop_scan(self): ...
@@ -1,15 +1,36 @@
+import asyncio
 import logging
+import queue
 import threading
 import time
-from typing import Any, Callable, List, Optional
+from operator import attrgetter
+from typing import Any, Callable, Optional
 
+import numpy as np
 from pyrplidar import PyRPlidar, PyRPlidarConnectionError, PyRPlidarProtocolError
 
-from ..core.models import LidarConfig
-from .base import BaseLidar, LidarStatus
+from ..core.models import ANGLE_UNITS_PER_DEGREE, LidarConfig
+from .base import BaseLidar, LidarStatus, ScanCallback
 
 logger = logging.getLogger(__name__)
 
+# Packed point layout filled by np.fromiter in a single C loop per revolution.
+# Fields are quantized to uint16: angle in 0.01 degree, distance in mm, raw quality.
+SCAN_DTYPE = np.dtype([("angle", np.uint16), ("distance", np.uint16), ("intensity", np.uint16)])
+
+# Reads every measurement field the scan loop needs in one C-level call
+_measurement_fields = attrgetter("start_flag", "quality", "angle", "distance")
+
+
+def _resolve(future: asyncio.Future, result: Any, error: Optional[BaseException]):
+    """Complete a command future on its event loop (ignored if already cancelled)."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
 
 class PyRPlidarImpl(BaseLidar):
     """
@@ -22,6 +43,13 @@ class PyRPlidarImpl(BaseLidar):
     MAX_PWM = 1023
     DEFAULT_PWM = 600
 
+    # Shortest rotor settle time when reconfiguring PWM
+    MIN_SETTLE_SECONDS = 0.2
+
+    # Reusable per-revolution column buffers, grown when a revolution does not fit
+    SCAN_BUFFER_POINTS = 2048
+    SCAN_RING_SIZE = 4
+
     def __init__(self, config: LidarConfig):
         self._port = config.port
         self._baudrate = config.baudrate
@@ -34,11 +62,59 @@ class PyRPlidarImpl(BaseLidar):
 
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
-        self._callback: Optional[Callable[[List[Any]], None]] = None
+        self._callback: Optional[ScanCallback] = None
+
+        # Scans handed to the callback alias these buffers and stay valid
+        # for SCAN_RING_SIZE revolutions
+        self._scan_ring = [
+            np.empty((3, self.SCAN_BUFFER_POINTS), dtype=np.uint16)
+            for _ in range(self.SCAN_RING_SIZE)
+        ]
+        self._ring_idx = 0
+
+        # Long-lived worker serializing blocking commands (connect, reconfigure, ...),
+        # started on the first submit()
+        self._cmd_q: queue.Queue = queue.Queue()
+        self._cmd_thread: Optional[threading.Thread] = None
+        self._cmd_lock = threading.Lock()
 
     def get_status(self) -> LidarStatus:
         return self._status
 
+    def submit(self, fn: Callable[..., Any], *args: Any) -> asyncio.Future:
+        """
+        Run a blocking HAL command on the dedicated command thread.
+        Must be called from the event loop; the returned future resolves on it.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        with self._cmd_lock:
+            if self._cmd_thread is None or not self._cmd_thread.is_alive():
+                self._cmd_thread = threading.Thread(
+                    target=self._cmd_loop, name=f"LidarCmd-{self._port[-4:]}", daemon=True
+                )
+                self._cmd_thread.start()
+
+        self._cmd_q.put((fn, args, loop, future))
+        return future
+
+    def _cmd_loop(self):
+        """Execute submitted commands one at a time, in submission order."""
+        while True:
+            fn, args, loop, future = self._cmd_q.get()
+            # The worker must outlive any single command, whatever it raises
+            try:
+                outcome = (fn(*args), None)
+            except BaseException as e:
+                outcome = (None, e)
+
+            try:
+                loop.call_soon_threadsafe(_resolve, future, *outcome)
+            except RuntimeError:
+                # The submitting loop was closed before the command finished
+                logger.warning(f"Dropping result of {fn!r}: event loop is closed")
+
     def connect(self):
         """Establish connection and initialize the motor with parameters."""
         logger.info(f"Connecting to LiDAR on {self._port} (Baud: {self._baudrate})...")
@@ -75,25 +151,56 @@ class PyRPlidarImpl(BaseLidar):
 
     def _run_scan_loop(self):
         """Internal loop for reading data with batching by rotations."""
-        batch = []
         try:
             # Start scanning (optional parameters for scan mode can be added here)
             scan_generator = self._lidar.start_scan()
             logger.info("Scan generator started.")
 
-            for measurement in scan_generator():
-                if self._stop_event.is_set():
-                    break
-
-                # Check for new rotation (use corrected start_flag)
-                if measurement.start_flag and batch:
-                    if self._callback:
-                        self._callback(batch)
-                    batch = []
-
-                # Filter by quality (valid points)
-                if measurement.quality > 0:
-                    batch.append(measurement)
+            measurements = scan_generator()
+            head = None  # (quality, angle, distance) of the measurement opening the next revolution
+            finished = False
+
+            def revolution():
+                """Yield valid points of one revolution, stopping at the next start flag."""
+                nonlocal head, finished
+                if head is not None and head[0] > 0:
+                    quality, angle, distance = head
+                    yield (angle * ANGLE_UNITS_PER_DEGREE, distance, quality)
+
+                for measurement in measurements:
+                    if self._stop_event.is_set():
+                        break
+
+                    start_flag, quality, angle, distance = _measurement_fields(measurement)
+
+                    # Check for new rotation (use corrected start_flag)
+                    if start_flag:
+                        head = (quality, angle, distance)
+                        return
+
+                    # Filter by quality (valid points)
+                    if quality > 0:
+                        yield (angle * ANGLE_UNITS_PER_DEGREE, distance, quality)
+
+                finished = True
+
+            while not finished:
+                points = np.fromiter(revolution(), dtype=SCAN_DTYPE)
+                if finished or not len(points) or not self._callback:
+                    continue
+
+                # Transpose into the next ring buffer: one contiguous row per field
+                n = len(points)
+                columns = self._scan_ring[self._ring_idx]
+                if n > columns.shape[1]:
+                    # Slow rotation: enlarge this slot instead of dropping points
+                    capacity = max(n, 2 * columns.shape[1])
+                    logger.info(f"Revolution of {n} points; growing scan buffer to {capacity}")
+                    columns = np.empty((3, capacity), dtype=np.uint16)
+                    self._scan_ring[self._ring_idx] = columns
+                self._ring_idx = (self._ring_idx + 1) % self.SCAN_RING_SIZE
+                columns[:, :n] = points.view(np.uint16).reshape(-1, 3).T
+                self._callback(columns[0, :n], columns[1, :n], columns[2, :n], time.time())
 
         except PyRPlidarProtocolError as e:
             logger.error(f"LiDAR Protocol error: {e}")
@@ -116,7 +223,7 @@ class PyRPlidarImpl(BaseLidar):
         if self._status != LidarStatus.ERROR:
             self._status = LidarStatus.READY
 
-    def start_scan(self, callback: Callable[[List[Any]], None]):
+    def start_scan(self, callback: ScanCallback):
         """Start background scanning thread."""
         if self._status not in [LidarStatus.READY, LidarStatus.ERROR]:
             logger.error(f"Cannot start scan: Device in state {self._status}")
@@ -150,12 +257,12 @@ class PyRPlidarImpl(BaseLidar):
 
     def _validate_pwm(self, pwm: int) -> int:
         """Verify PWM is within RPLIDAR C1 physical limits."""
-        if not (self.MIN_PWM <= pwm <= self.MAX_PWM):
+        clipped = min(max(pwm, self.MIN_PWM), self.MAX_PWM)
+        if clipped != pwm:
             logger.warning(
                 f"PWM {pwm} is out of hardware bounds. Clipping to [{self.MIN_PWM}, {self.MAX_PWM}]"
             )
-            return max(self.MIN_PWM, min(pwm, self.MAX_PWM))
-        return pwm
+        return clipped
 
     def update_parameters(self, motor_pwm: Optional[int] = None):
         """
@@ -181,7 +288,9 @@ class PyRPlidarImpl(BaseLidar):
         # 2. Complete hardware reset for PWM change
         try:
             self._lidar.stop()
-            time.sleep(self._warmup_seconds)  # Allow rotor to slow down
+            # Allow rotor to settle; bigger PWM jumps need longer
+            delta_ratio = abs(new_pwm - self._motor_pwm) / self.MAX_PWM
+            time.sleep(max(self.MIN_SETTLE_SECONDS, self._warmup_seconds * delta_ratio))
 
             self._motor_pwm = new_pwm
             self._lidar.set_motor_pwm(self._motor_pwm)
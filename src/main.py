@@ -4,6 +4,7 @@ import logging
 import sys
 
 import uvicorn
+import uvloop
 
 from src.core.manager import LidarManager
 from src.transports.rest_api import create_app
@@ -58,7 +59,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
     except KeyboardInterrupt:
         pass
 
@@ -66,6 +67,6 @@ if __name__ == "__main__":
 def run_app():
     """Entry point for the console script."""
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
     except KeyboardInterrupt:
         pass
@@ -1,14 +1,23 @@
 import logging
 from typing import Any, Dict
 
-from fastapi import Body, FastAPI, HTTPException, WebSocket, WebSocketDisconnect, status
+import orjson
+from fastapi import Body, FastAPI, HTTPException, Response, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import JSONResponse
 
 from src.core.manager import LidarManager
-from src.core.models import LidarConfig, LidarScan, WSMessage
+from src.core.models import LidarConfig
 
 logger = logging.getLogger(__name__)
 
 
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson (fastapi.responses.ORJSONResponse is deprecated)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
 def create_app(manager: LidarManager) -> FastAPI:
     """
     Creates a FastAPI application with professional OpenAPI documentation
@@ -21,6 +30,7 @@ def create_app(manager: LidarManager) -> FastAPI:
         contact={
             "name": "Lidar Service Maintainer",
         },
+        default_response_class=OrjsonResponse,
     )
 
     # --- SYSTEM & STATUS ---
@@ -121,9 +131,21 @@ def create_app(manager: LidarManager) -> FastAPI:
         "/scan/latest",
         tags=["Data"],
         summary="Get the most recent LiDAR scan",
-        response_model=LidarScan,
+        response_class=Response,
         responses={
-            200: {"description": "Successfully retrieved the last completed 360° scan."},
+            200: {
+                "description": "Successfully retrieved the last completed 360° scan.",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "timestamp": 1704123456.789,
+                            "angles": [0.0, 0.8],
+                            "distances": [150, 152],
+                            "intensities": [45, 47],
+                        }
+                    }
+                },
+            },
             404: {"description": "No scan data available (device might be warming up or stopped)."},
         },
     )
@@ -131,13 +153,37 @@ def create_app(manager: LidarManager) -> FastAPI:
         """
         Returns the last successfully completed 360-degree rotation batch.
         Use this for snapshots or low-frequency monitoring.
+        The body is the same `data` object streamed over `/ws/scan`, served from cache.
         """
-        scan = manager.last_scan
-        if scan is None:
+        content = manager.last_scan_json
+        if content is None:
             raise HTTPException(
                 status_code=404, detail="No scan data available. Is the LiDAR scanning?"
             )
-        return scan
+        return Response(content=content, media_type="application/json")
+
+    async def stream_scans(websocket: WebSocket, binary: bool):
+        """Pump pre-encoded scans from a manager slot into the socket until it closes."""
+        await websocket.accept()
+
+        # Subscribe to L2 Manager
+        slot = manager.subscribe(binary=binary)
+        send = websocket.send_bytes if binary else websocket.send_text
+        logger.info(f"WebSocket client connected: {websocket.client}")
+
+        try:
+            while True:
+                # Fetch the latest pre-encoded scan from the fan-out slot
+                payload = await slot.get()
+
+                await send(payload)
+
+        except WebSocketDisconnect:
+            logger.info(f"WebSocket client disconnected: {websocket.client}")
+        except Exception as e:
+            logger.error(f"WebSocket internal error: {e}")
+        finally:
+            manager.unsubscribe(slot)
 
     @app.websocket("/ws/scan")
     async def websocket_endpoint(websocket: WebSocket):
@@ -148,33 +194,31 @@ def create_app(manager: LidarManager) -> FastAPI:
         **Data Format:**
         All messages follow the `WSMessage` schema:
         - `type`: "lidar_scan"
-        - `data`: Full `LidarScan` object.
+        - `data`: Scan timestamp and parallel `angles`, `distances`, `intensities` arrays.
+
+        Frames are pre-encoded: each scan is serialized once by the manager
+        and the same text frame is sent as-is to every client.
 
         **Flow Control:**
         Utilizes a 'Drop Oldest' policy. If the client falls behind,
-        stale scans are discarded to ensure minimum latency.
+        only the newest scan is kept and stale scans are discarded to ensure minimum latency.
         """
-        await websocket.accept()
-
-        # Subscribe to L2 Manager
-        queue = manager.subscribe()
-        logger.info(f"WebSocket client connected: {websocket.client}")
-
-        try:
-            while True:
-                # Fetch next scan from the fan-out queue
-                scan = await queue.get()
+        await stream_scans(websocket, binary=False)
 
-                message = WSMessage(type="lidar_scan", data=scan)
-                await websocket.send_json(message.model_dump())
+    @app.websocket("/ws/scan/bin")
+    async def websocket_binary_endpoint(websocket: WebSocket):
+        """
+        ### WebSocket: Binary Data Stream
+        Same stream as `/ws/scan`, packed into one binary frame per revolution
+        (6 bytes per point).
 
-                queue.task_done()
+        **Frame Layout (little-endian):**
+        - `float64` timestamp, `uint32` point count `n`
+        - `n` x `uint16` angles (0.01°), then distances (mm), then intensities
 
-        except WebSocketDisconnect:
-            logger.info(f"WebSocket client disconnected: {websocket.client}")
-        except Exception as e:
-            logger.error(f"WebSocket internal error: {e}")
-        finally:
-            manager.unsubscribe(queue)
+        **Flow Control:**
+        Same 'Drop Oldest' policy as `/ws/scan`.
+        """
+        await stream_scans(websocket, binary=True)
 
     return app
@@ -4,11 +4,16 @@ import yaml
 
 from src.core.models import AppConfig
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
 
 def load_app_config(path: str) -> AppConfig:
     with open(path, "r") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
 
     return AppConfig(**data)